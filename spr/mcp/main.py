@@ -1,11 +1,33 @@
+import asyncio
 import os
-import requests
-from typing import Dict, Any, List
-from mcp.server.fastmcp import FastMCP
+from contextlib import asynccontextmanager
+from typing import Dict, Any, List, AsyncIterator, Optional
+
+import httpx
+from mcp.server.fastmcp import Context, FastMCP
 
 API_BASE = os.getenv("TRACE_API_BASE", "http://localhost:8001")
 
-mcp = FastMCP("tracee-analysis")
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    One pooled keep-alive client per server run (i.e. per SSE or
+    streamable-HTTP session), closed when that run ends.
+    """
+    async with httpx.AsyncClient(
+        base_url=API_BASE,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        timeout=30.0,
+    ) as client:
+        yield client
+
+
+mcp = FastMCP("tracee-analysis", lifespan=lifespan)
+
+
+def _client(ctx: Context) -> httpx.AsyncClient:
+    return ctx.request_context.lifespan_context
 
 
 # =====================================================
@@ -13,9 +35,9 @@ mcp = FastMCP("tracee-analysis")
 # =====================================================
 
 @mcp.tool()
-def health() -> Dict[str, Any]:
+async def health(ctx: Context) -> Dict[str, Any]:
     """Check if the Tracee API is healthy."""
-    r = requests.get(f"{API_BASE}/health")
+    r = await _client(ctx).get("/health")
     r.raise_for_status()
     return r.json()
 
@@ -25,7 +47,7 @@ def health() -> Dict[str, Any]:
 # =====================================================
 
 @mcp.tool()
-def list_collections() -> List[str]:
+async def list_collections(ctx: Context) -> List[str]:
     """
     List available collections.
     (Calls Mongo indirectly via FastAPI if you add an endpoint for it.)
@@ -33,7 +55,7 @@ def list_collections() -> List[str]:
     # If you don’t have a list endpoint yet,
     # you should add one in FastAPI:
     # GET /collections
-    r = requests.get(f"{API_BASE}/collections")
+    r = await _client(ctx).get("/collections")
     r.raise_for_status()
     return r.json()
 
@@ -43,9 +65,16 @@ def list_collections() -> List[str]:
 # =====================================================
 
 @mcp.tool()
-def get_stats(collection_name: str) -> Dict[str, Any]:
-    """Get aggregated behavioral stats."""
-    r = requests.get(f"{API_BASE}/stats/{collection_name}")
+async def get_stats(
+    collection_name: str,
+    ctx: Context,
+    top_n: int = 500
+) -> Dict[str, Any]:
+    """Get aggregated behavioral stats (top_n entries per section)."""
+    r = await _client(ctx).get(
+        f"/stats/{collection_name}",
+        params={"top_n": top_n}
+    )
     r.raise_for_status()
     return r.json()
 
@@ -55,21 +84,24 @@ def get_stats(collection_name: str) -> Dict[str, Any]:
 # =====================================================
 
 @mcp.tool()
-def get_dns_activity(
+async def get_dns_activity(
     collection_name: str,
+    ctx: Context,
     dns: str,
     limit: int = 50,
-    offset: int = 0
+    offset: int = 0,
+    after: Optional[str] = None
 ) -> Dict[str, Any]:
     """Get DNS drill-down data."""
-    r = requests.get(
-        f"{API_BASE}/specific/{collection_name}",
-        params={
-            "dns": dns,
-            "limit": limit,
-            "offset": offset
-        }
-    )
+    params = {
+        "dns": dns,
+        "limit": limit,
+        "offset": offset
+    }
+    if after is not None:
+        params["after"] = after
+
+    r = await _client(ctx).get(f"/specific/{collection_name}", params=params)
     r.raise_for_status()
     return r.json()
 
@@ -79,21 +111,24 @@ def get_dns_activity(
 # =====================================================
 
 @mcp.tool()
-def get_command_activity(
+async def get_command_activity(
     collection_name: str,
+    ctx: Context,
     command: str,
     limit: int = 50,
-    offset: int = 0
+    offset: int = 0,
+    after: Optional[str] = None
 ) -> Dict[str, Any]:
     """Get execve drill-down data."""
-    r = requests.get(
-        f"{API_BASE}/specific/{collection_name}",
-        params={
-            "command": command,
-            "limit": limit,
-            "offset": offset
-        }
-    )
+    params = {
+        "command": command,
+        "limit": limit,
+        "offset": offset
+    }
+    if after is not None:
+        params["after"] = after
+
+    r = await _client(ctx).get(f"/specific/{collection_name}", params=params)
     r.raise_for_status()
     return r.json()
 
@@ -103,24 +138,61 @@ def get_command_activity(
 # =====================================================
 
 @mcp.tool()
-def get_file_activity(
+async def get_file_activity(
     collection_name: str,
+    ctx: Context,
     file: str,
     limit: int = 50,
-    offset: int = 0
+    offset: int = 0,
+    after: Optional[str] = None
 ) -> Dict[str, Any]:
     """Get file access drill-down data."""
-    r = requests.get(
-        f"{API_BASE}/specific/{collection_name}",
-        params={
-            "file": file,
-            "limit": limit,
-            "offset": offset
-        }
-    )
+    params = {
+        "file": file,
+        "limit": limit,
+        "offset": offset
+    }
+    if after is not None:
+        params["after"] = after
+
+    r = await _client(ctx).get(f"/specific/{collection_name}", params=params)
     r.raise_for_status()
     return r.json()
 
 
+# =====================================================
+# TOOL: Overview (concurrent fan-out)
+# =====================================================
+
+@mcp.tool()
+async def get_overview(
+    collection_name: str,
+    ctx: Context,
+    dns: Optional[str] = None,
+    command: Optional[str] = None,
+    file: Optional[str] = None,
+    limit: int = 50
+) -> Dict[str, Any]:
+    """
+    Get aggregated stats plus any requested drill-downs in one call.
+    Requests are issued concurrently over the session's pooled client.
+    """
+    names = ["stats"]
+    calls = [get_stats(collection_name, ctx)]
+
+    if dns:
+        names.append("dns")
+        calls.append(get_dns_activity(collection_name, ctx, dns, limit=limit))
+    if command:
+        names.append("command")
+        calls.append(get_command_activity(collection_name, ctx, command, limit=limit))
+    if file:
+        names.append("file")
+        calls.append(get_file_activity(collection_name, ctx, file, limit=limit))
+
+    results = await asyncio.gather(*calls)
+    return dict(zip(names, results))
+
+
 if __name__ == "__main__":
     mcp.run()
@@ -1,16 +1,26 @@
-import json
+import orjson
 import uuid
 from datetime import datetime
 from typing import Generator
 from typing import Optional
 from datetime import datetime
-from pymongo import MongoClient, ASCENDING
+from pymongo import MongoClient, ASCENDING, IndexModel
 from pymongo.errors import BulkWriteError
-from collections import defaultdict
+from bson import ObjectId
+from bson.errors import InvalidId
+from collections import defaultdict, Counter
+from itertools import islice
 from fastapi import FastAPI, UploadFile, File, HTTPException, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
 import os
+import re
+import threading
+import time
 
-app = FastAPI(title="Tracee Ingestion Service")
+app = FastAPI(
+    title="Tracee Ingestion Service",
+    default_response_class=ORJSONResponse
+)
 
 # ---- MongoDB Configuration ----
 import os
@@ -19,9 +29,56 @@ from pymongo import MongoClient
 MONGO_URI = os.getenv("MONGO_URI", "mongodb://mongo:27017")
 DB_NAME = os.getenv("DB_NAME", "tracee_analysis")
 
-client = MongoClient(MONGO_URI)
+# Single shared client; handlers must not create their own
+client = MongoClient(
+    MONGO_URI,
+    maxPoolSize=50,
+    minPoolSize=5,
+    compressors="zstd,snappy,zlib",
+    retryWrites=True,
+    appname="tracee-ingest"
+)
 db = client[DB_NAME]
 
+# Per-collection summaries precomputed at ingest time
+SUMMARY_COLLECTION = "_summaries"
+
+# ---- Known collection names (refreshed lazily) ----
+COLLECTION_CACHE_TTL = 5.0
+_COLL_CACHE = {"names": set(), "ts": 0.0}
+
+
+def _known(collection_name: str) -> bool:
+    """
+    Check whether a trace collection exists without a listCollections
+    round-trip on every request. The internal summaries collection is
+    never served.
+    """
+    if collection_name == SUMMARY_COLLECTION:
+        return False
+
+    now = time.monotonic()
+    if now - _COLL_CACHE["ts"] > COLLECTION_CACHE_TTL:
+        _COLL_CACHE["names"] = set(db.list_collection_names())
+        _COLL_CACHE["ts"] = now
+    return collection_name in _COLL_CACHE["names"]
+
+
+# ---- Indexes built on every uploaded collection ----
+TRACE_INDEXES = [
+    # Also serves /specific keyset pagination on (timestamp, _id)
+    IndexModel([("timestamp", ASCENDING), ("_id", ASCENDING)]),
+    IndexModel([("processId", ASCENDING)]),
+    IndexModel([("container.id", ASCENDING)]),
+    # Prefixes serve eventName and (eventName, args.name) lookups too
+    IndexModel([
+        ("eventName", ASCENDING),
+        ("args.name", ASCENDING),
+        ("args.value", ASCENDING)
+    ]),
+    IndexModel([("args.value.query", ASCENDING)]),
+]
+
 
 # ---- Helper: Stream JSON Lines ----
 def stream_json_lines(file) -> Generator[dict, None, None]:
@@ -31,20 +88,45 @@ def stream_json_lines(file) -> Generator[dict, None, None]:
     """
     for line in file:
         try:
-            yield json.loads(line)
-        except json.JSONDecodeError:
+            yield orjson.loads(line)
+        except orjson.JSONDecodeError:
             continue
 
 
+def _is_field_name(name) -> bool:
+    """Whether an eventName can be used as a key under syscall_profile."""
+    return (
+        isinstance(name, str)
+        and name != ""
+        and "." not in name
+        and not name.startswith("$")
+    )
+
+
+def _insert_batch(collection, batch: list) -> list:
+    """
+    Insert a batch unordered and return the documents that were written.
+    A failing document no longer aborts the rest of the batch.
+    """
+    try:
+        collection.insert_many(batch, ordered=False)
+        return batch
+    except BulkWriteError as e:
+        failed = {err["index"] for err in e.details["writeErrors"]}
+        return [doc for i, doc in enumerate(batch) if i not in failed]
+
+
 # ---- Endpoint: Upload Tracee File ----
 @app.post("/upload-tracee")
-async def upload_tracee(
+def upload_tracee(
     collection_name: str = Query(..., description="MongoDB collection name"),
     file: UploadFile = File(...)
 ):
     """
     Upload a Tracee JSONL file.
     Inserts every trace event as its own document into the given collection.
+    Declared sync so FastAPI runs the whole ingest, reads and Mongo calls
+    alike, in its threadpool instead of on the event loop.
     """
 
     allowed_extensions = (".json", ".jsonl", ".log")
@@ -56,55 +138,102 @@ async def upload_tracee(
         )
 
     # Validate collection name (basic safety)
-    if not collection_name.isidentifier():
+    if not collection_name.isidentifier() or collection_name == SUMMARY_COLLECTION:
         raise HTTPException(
             status_code=400,
             detail="Invalid collection name"
         )
 
     collection = db[collection_name]
+    _COLL_CACHE["names"].add(collection_name)
 
-    # Optional: create indexes
-    collection.create_index([("timestamp", ASCENDING)])
-    collection.create_index([("processId", ASCENDING)])
-    collection.create_index([("eventName", ASCENDING)])
-    collection.create_index([("container.id", ASCENDING)])
+    summaries = db[SUMMARY_COLLECTION]
+
+    # Only keep a summary if it will cover every event in the collection
+    track_summary = (
+        collection.estimated_document_count() == 0
+        or summaries.count_documents({"collection": collection_name}, limit=1) > 0
+    )
+    ev_counter = Counter()
 
     batch_size = 1000
     batch = []
     inserted_count = 0
+    failed_count = 0
+    leftover = b""
 
     try:
         while True:
-            chunk = await file.read(1024 * 1024)
+            chunk = file.file.read(1024 * 1024)
             if not chunk:
                 break
 
-            lines = chunk.decode("utf-8").splitlines()
+            # Split on raw bytes; the last piece may be a partial line
+            lines = (leftover + chunk).split(b"\n")
+            leftover = lines.pop()
 
             for line in lines:
+                if not line:
+                    continue
                 try:
-                    event = json.loads(line)
-                    batch.append(event)
-                except json.JSONDecodeError:
+                    batch.append(orjson.loads(line))
+                except orjson.JSONDecodeError:
                     continue
 
                 if len(batch) >= batch_size:
-                    collection.insert_many(batch)
-                    inserted_count += len(batch)
+                    written = _insert_batch(collection, batch)
+                    inserted_count += len(written)
+                    failed_count += len(batch) - len(written)
+                    ev_counter.update(e.get("eventName") for e in written)
                     batch = []
 
-        if batch:
-            collection.insert_many(batch)
-            inserted_count += len(batch)
+        if leftover:
+            try:
+                batch.append(orjson.loads(leftover))
+            except orjson.JSONDecodeError:
+                pass
 
-    except BulkWriteError as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        if batch:
+            written = _insert_batch(collection, batch)
+            inserted_count += len(written)
+            failed_count += len(batch) - len(written)
+            ev_counter.update(e.get("eventName") for e in written)
+
+        # Build indexes once over the loaded data rather than maintaining
+        # them on every insert. A single createIndexes command builds them
+        # all in one scan.
+        collection.create_indexes(TRACE_INDEXES)
+
+        if track_summary and not all(map(_is_field_name, ev_counter)):
+            # The $group fallback copes with any eventName; the summary can't
+            summaries.delete_one({"collection": collection_name})
+        elif track_summary:
+            summaries.create_index([("collection", ASCENDING)], unique=True)
+            increments = {
+                f"syscall_profile.{name}": count
+                for name, count in ev_counter.items()
+            }
+            increments["total"] = inserted_count
+            summaries.update_one(
+                {"collection": collection_name},
+                {"$inc": increments},
+                upsert=True
+            )
+
+    except Exception:
+        # Some batches may already be written without being counted; drop
+        # the summary so /stats falls back to aggregating the collection
+        summaries.delete_one({"collection": collection_name})
+        raise
+    finally:
+        # Collection contents changed, cached stats are stale
+        _STATS_CACHE.pop(collection_name, None)
 
     return {
         "status": "success",
         "collection": collection_name,
-        "documents_inserted": inserted_count
+        "documents_inserted": inserted_count,
+        "documents_failed": failed_count
     }
 
 SENSITIVE_PATHS = [
@@ -121,19 +250,53 @@ SHELL_BINARIES = [
     "bash"
 ]
 
+# Substring alternations so risk checks can run server-side as $regex
+SENSITIVE_RE = "|".join(map(re.escape, SENSITIVE_PATHS))
+SHELL_RE = "|".join(map(re.escape, SHELL_BINARIES))
+PROCFS_RE = re.escape("/proc")
 
-@app.get("/stats/{collection_name}")
-def get_stats(collection_name: str):
-    if collection_name not in db.list_collection_names():
-        raise HTTPException(status_code=404, detail="Collection not found")
+# All /stats sections come back in one $facet document, capped at 16 MB.
+# files and execs keys are pathnames of up to PATH_MAX (4 KB), so two
+# sections of 1000 entries stay around 8 MB; dns names and addrs are small.
+# Uploads with longer arbitrary pathnames can still exceed the cap.
+MAX_TOP_N = 1000
 
-    collection = db[collection_name]
+# Memoized /stats results: collection -> (expires_at, stats at MAX_TOP_N)
+STATS_CACHE_TTL = 60.0
+STATS_CACHE_SIZE = 32
+_STATS_CACHE = {}
+_STATS_CACHE_LOCK = threading.Lock()
+
+# Events read by the /stats sections other than the syscall profile
+STATS_EVENTS = ["openat", "execve", "connect", "net_packet_dns_request"]
+
+
+def _any_arg_matches(event_name: str, arg_name: str, pattern: str) -> list:
+    """
+    Pipeline yielding at most one event whose arg value matches pattern.
+    The $limit only caps the output: inside $facet every input document is
+    still fed through the shared scan, and with no match every event_name
+    document is regex-tested.
+    """
+    return [
+        {
+            "$match": {
+                "eventName": event_name,
+                "args": {
+                    "$elemMatch": {
+                        "name": arg_name,
+                        "value": {"$regex": pattern}
+                    }
+                }
+            }
+        },
+        {"$limit": 1},
+        {"$project": {"_id": 1}}
+    ]
 
-    # -------------------------
-    # Total events
-    # -------------------------
-    total_events = collection.count_documents({})
 
+def _stats_pipelines(top_n: int) -> dict:
+    """Aggregation pipelines behind each /stats section."""
     # -------------------------
     # Syscall frequency
     # -------------------------
@@ -141,88 +304,68 @@ def get_stats(collection_name: str):
         {"$group": {"_id": "$eventName", "count": {"$sum": 1}}},
         {"$sort": {"count": -1}}
     ]
-    syscall_profile = {
-        item["_id"]: item["count"]
-        for item in collection.aggregate(syscall_pipeline)
-    }
 
     # -------------------------
     # File access (paths + counts)
     # -------------------------
     file_pipeline = [
-        {"$match": {"eventName": "openat"}},
+        {
+            "$match": {
+                "eventName": "openat",
+                "args": {"$elemMatch": {"name": "pathname"}}
+            }
+        },
         {"$unwind": "$args"},
         {"$match": {"args.name": "pathname"}},
         {"$group": {"_id": "$args.value", "count": {"$sum": 1}}},
-        {"$sort": {"count": -1}}
-    ]
-    file_results = list(collection.aggregate(file_pipeline))
-
-    file_access = {
-        item["_id"]: item["count"]
-        for item in file_results
-    }
-
-    sensitive_hits = [
-        path for path in file_access
-        if any(s in path for s in SENSITIVE_PATHS)
+        {"$sort": {"count": -1}},
+        {"$limit": top_n}
     ]
 
     # -------------------------
     # Executed commands (execve)
     # -------------------------
     exec_pipeline = [
-        {"$match": {"eventName": "execve"}},
+        {
+            "$match": {
+                "eventName": "execve",
+                "args": {"$elemMatch": {"name": "pathname"}}
+            }
+        },
         {"$unwind": "$args"},
         {"$match": {"args.name": "pathname"}},
         {"$group": {"_id": "$args.value", "count": {"$sum": 1}}},
-        {"$sort": {"count": -1}}
+        {"$sort": {"count": -1}},
+        {"$limit": top_n}
     ]
-    exec_results = list(collection.aggregate(exec_pipeline))
-
-    executed_commands = {
-        item["_id"]: item["count"]
-        for item in exec_results
-    }
-
-    shell_spawned = any(
-        any(shell in cmd for shell in SHELL_BINARIES)
-        for cmd in executed_commands
-    )
 
     # -------------------------
     # Network IP aggregation (SAFE VERSION)
     # -------------------------
     ip_pipeline = [
-        {"$match": {"eventName": "connect"}},
+        {
+            "$match": {
+                "eventName": "connect",
+                "args": {"$elemMatch": {"name": "addr"}}
+            }
+        },
         {"$unwind": "$args"},
         {"$match": {"args.name": "addr"}},
         {"$group": {"_id": "$args.value", "count": {"$sum": 1}}},
-        {"$sort": {"count": -1}}
+        {"$sort": {"count": -1}},
+        {"$limit": top_n}
     ]
 
-    ip_results = list(collection.aggregate(ip_pipeline))
-
-    ip_usage = {}
-
-    for item in ip_results:
-        addr = item["_id"]
-
-        # If Tracee stored addr as dict
-        if isinstance(addr, dict):
-            ip = addr.get("ip", "unknown")
-            port = addr.get("port", "")
-            key = f"{ip}:{port}" if port else ip
-        else:
-            key = str(addr)
-
-        ip_usage[key] = item["count"]
-
     # -------------------------
     # DNS aggregation (CORRECT TRACEe VERSION)
     # -------------------------
     dns_pipeline = [
-        {"$match": {"eventName": "net_packet_dns_request"}},
+        {
+            "$match": {
+                "eventName": "net_packet_dns_request",
+                "args": {"$elemMatch": {"name": "dns_questions"}}
+            }
+        },
         {"$unwind": "$args"},
         {"$match": {"args.name": "dns_questions"}},
         {"$unwind": "$args.value"},
@@ -232,32 +375,188 @@ def get_stats(collection_name: str):
                 "count": {"$sum": 1}
             }
         },
-        {"$sort": {"count": -1}}
+        {"$sort": {"count": -1}},
+        {"$limit": top_n}
     ]
 
-    dns_results = list(collection.aggregate(dns_pipeline))
-
-    dns_usage = {
-        item["_id"]: item["count"]
-        for item in dns_results
+    return {
+        "syscalls": syscall_pipeline,
+        "files": file_pipeline,
+        "execs": exec_pipeline,
+        "ips": ip_pipeline,
+        "dns": dns_pipeline
     }
-    # -------------------------
-    # Risk Flags
-    # -------------------------
+
+
+def _summary_profile(summary: dict) -> dict:
+    """Ingest-time syscall counts, most frequent first like the $group output."""
+    return dict(sorted(
+        summary.get("syscall_profile", {}).items(),
+        key=lambda item: item[1],
+        reverse=True
+    ))
+
+
+def _addr_key(addr) -> str:
+    # If Tracee stored addr as dict
+    if isinstance(addr, dict):
+        ip = addr.get("ip", "unknown")
+        port = addr.get("port", "")
+        return f"{ip}:{port}" if port else ip
+    return str(addr)
+
+
+def _risk_flags(sensitive: bool, shell: bool, network: bool, procfs: bool) -> list:
     risk_flags = []
 
-    if sensitive_hits:
+    if sensitive:
         risk_flags.append("sensitive_file_access")
 
-    if shell_spawned:
+    if shell:
         risk_flags.append("shell_spawned")
 
-    if ip_usage:
+    if network:
         risk_flags.append("network_activity")
 
-    if any("/proc" in path for path in file_access):
+    if procfs:
         risk_flags.append("procfs_access")
 
+    return risk_flags
+
+
+@app.get("/stats/{collection_name}")
+def get_stats(
+    collection_name: str,
+    top_n: int = Query(
+        500,
+        ge=1,
+        le=MAX_TOP_N,
+        description="Max entries per top-N section"
+    )
+):
+    if not _known(collection_name):
+        raise HTTPException(status_code=404, detail="Collection not found")
+
+    stats = _cached_stats(collection_name)
+    network = stats["network_activity"]
+
+    # Returned as a Response so the large payload goes straight to orjson
+    # instead of first walking FastAPI's jsonable_encoder
+    return ORJSONResponse({
+        **stats,
+        "file_access": _top(stats["file_access"], top_n),
+        "executed_commands": _top(stats["executed_commands"], top_n),
+        "network_activity": {
+            "ips": _top(network["ips"], top_n),
+            "dns_records": _top(network["dns_records"], top_n)
+        }
+    })
+
+
+def _top(section: dict, top_n: int) -> dict:
+    # Sections are already ordered by count, most frequent first
+    return dict(islice(section.items(), top_n))
+
+
+def _cached_stats(collection_name: str) -> dict:
+    """
+    Stats for a collection at MAX_TOP_N, reused for up to STATS_CACHE_TTL.
+    upload_tracee drops this worker's entry right away; the TTL covers
+    /stats calls racing an upload and uploads handled by other workers.
+    """
+    now = time.monotonic()
+    entry = _STATS_CACHE.get(collection_name)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+
+    stats = _compute_stats(collection_name, MAX_TOP_N)
+
+    with _STATS_CACHE_LOCK:
+        # Drop expired entries, then the oldest, to stay within the bound
+        for name, (expires_at, _) in list(_STATS_CACHE.items()):
+            if expires_at <= now:
+                del _STATS_CACHE[name]
+        _STATS_CACHE.pop(collection_name, None)
+        while len(_STATS_CACHE) >= STATS_CACHE_SIZE:
+            del _STATS_CACHE[next(iter(_STATS_CACHE))]
+        _STATS_CACHE[collection_name] = (now + STATS_CACHE_TTL, stats)
+
+    return stats
+
+
+def _compute_stats(collection_name: str, top_n: int) -> dict:
+    """Compute aggregated stats for a collection."""
+    collection = db[collection_name]
+
+    # Syscall profile precomputed at ingest, if available
+    summary = db[SUMMARY_COLLECTION].find_one({"collection": collection_name})
+
+    pipelines = _stats_pipelines(top_n)
+
+    # -------------------------
+    # Single pass over the collection for every section
+    # -------------------------
+    facet = {
+        "files": pipelines["files"],
+        "execs": pipelines["execs"],
+        "ips": pipelines["ips"],
+        "dns": pipelines["dns"],
+        "sensitive_hit": _any_arg_matches("openat", "pathname", SENSITIVE_RE),
+        "shell_hit": _any_arg_matches("execve", "pathname", SHELL_RE),
+        "procfs_hit": _any_arg_matches("openat", "pathname", PROCFS_RE)
+    }
+    pipeline = [{"$facet": facet}]
+
+    if summary is None:
+        facet["syscalls"] = pipelines["syscalls"]
+    else:
+        # $facet sub-pipelines cannot use indexes. Without the syscall
+        # profile every branch only needs these events, so narrow the scan
+        # feeding the facet with an index-backed $match.
+        pipeline.insert(0, {"$match": {"eventName": {"$in": STATS_EVENTS}}})
+    facets = next(collection.aggregate(pipeline, allowDiskUse=True))
+
+    if summary is not None:
+        total_events = summary["total"]
+        syscall_profile = _summary_profile(summary)
+    else:
+        # Collection metadata count; exact enough for a summary header
+        total_events = collection.estimated_document_count()
+
+        syscall_profile = {
+            item["_id"]: item["count"]
+            for item in facets["syscalls"]
+        }
+
+    file_access = {
+        item["_id"]: item["count"]
+        for item in facets["files"]
+    }
+
+    executed_commands = {
+        item["_id"]: item["count"]
+        for item in facets["execs"]
+    }
+
+    ip_usage = {
+        _addr_key(item["_id"]): item["count"]
+        for item in facets["ips"]
+    }
+
+    dns_usage = {
+        item["_id"]: item["count"]
+        for item in facets["dns"]
+    }
+    # -------------------------
+    # Risk Flags
+    # -------------------------
+    risk_flags = _risk_flags(
+        sensitive=bool(facets["sensitive_hit"]),
+        shell=bool(facets["shell_hit"]),
+        network=bool(ip_usage),
+        procfs=bool(facets["procfs_hit"])
+    )
+
     return {
         "collection": collection_name,
         "total_events": total_events,
@@ -271,16 +570,158 @@ def get_stats(collection_name: str):
         "risk_flags": risk_flags
     }# ---- Health Check ----
 
+@app.get("/stats/{collection_name}/stream")
+def stream_stats(
+    collection_name: str,
+    top_n: int = Query(
+        500,
+        ge=1,
+        le=MAX_TOP_N,
+        description="Max entries per top-N section"
+    )
+):
+    """
+    NDJSON variant of /stats for large collections.
+    Emits one record per entry of each section straight from the
+    aggregation cursors, so the full stats dict is never built in memory,
+    and ends with a summary record carrying the total and risk flags.
+    """
+    if not _known(collection_name):
+        raise HTTPException(status_code=404, detail="Collection not found")
+
+    return StreamingResponse(
+        _stream_stats(collection_name, top_n),
+        media_type="application/x-ndjson"
+    )
+
+
+def _stream_stats(collection_name: str, top_n: int) -> Generator[bytes, None, None]:
+    collection = db[collection_name]
+    summary = db[SUMMARY_COLLECTION].find_one({"collection": collection_name})
+    pipelines = _stats_pipelines(top_n)
+
+    def exists(pipeline: list) -> bool:
+        return next(collection.aggregate(pipeline), None) is not None
+
+    def record(section: str, **fields) -> bytes:
+        return orjson.dumps({"section": section, **fields}) + b"\n"
+
+    if summary is not None:
+        for name, count in _summary_profile(summary).items():
+            yield record("syscall_profile", key=name, count=count)
+    else:
+        for item in collection.aggregate(pipelines["syscalls"], allowDiskUse=True):
+            yield record("syscall_profile", key=item["_id"], count=item["count"])
+
+    has_network = False
+    sections = [
+        ("file_access", "files"),
+        ("executed_commands", "execs"),
+        ("ips", "ips"),
+        ("dns_records", "dns")
+    ]
+    for section, name in sections:
+        for item in collection.aggregate(pipelines[name], allowDiskUse=True):
+            if name == "ips":
+                has_network = True
+                key = _addr_key(item["_id"])
+            else:
+                key = item["_id"]
+            yield record(section, key=key, count=item["count"])
+
+    # Risk checks go last so they do not delay the first byte: each stops
+    # at its first match, but with no match it tests every openat/execve
+    # event
+    risk_flags = _risk_flags(
+        sensitive=exists(_any_arg_matches("openat", "pathname", SENSITIVE_RE)),
+        shell=exists(_any_arg_matches("execve", "pathname", SHELL_RE)),
+        network=has_network,
+        procfs=exists(_any_arg_matches("openat", "pathname", PROCFS_RE))
+    )
+
+    total_events = (
+        summary["total"] if summary is not None
+        else collection.estimated_document_count()
+    )
+    yield record(
+        "summary",
+        collection=collection_name,
+        total_events=total_events,
+        risk_flags=risk_flags
+    )
+
+
+# Fields read back by the /specific drill-downs
+SPECIFIC_PROJECTION = {
+    "processName": 1,
+    "processId": 1,
+    "parentProcessId": 1,
+    "executable.path": 1,
+    "timestamp": 1,
+    "args": 1,
+    "_id": 1  # keyset tie-breaker
+}
+
+
+def _parse_after(after: str) -> tuple:
+    """Decode a next_cursor value ("<timestamp>:<_id>") from a previous page."""
+    ts, _, oid = after.partition(":")
+    try:
+        ts = orjson.loads(ts)
+        oid = ObjectId(oid)
+    except (orjson.JSONDecodeError, InvalidId):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    if isinstance(ts, bool) or not isinstance(ts, (int, float)):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return ts, oid
+
+
+def _next_cursor(events: list, limit: int) -> Optional[str]:
+    # A short page is the last one
+    if len(events) < limit:
+        return None
+    last = events[-1]
+    return f"{orjson.dumps(last['timestamp']).decode()}:{last['_id']}"
+
+
+def _find_page(collection, query: dict, after: Optional[str], offset: int, limit: int) -> list:
+    """
+    Page through matching events in (timestamp, _id) order.
+    With after set, seeks past the previous page on the timestamp index
+    instead of skipping over it; _id breaks ties between events sharing a
+    timestamp. Events without a numeric timestamp cannot be ordered on
+    that key and are left out. The whole page comes back in one batch.
+    """
+    query = {**query, "timestamp": {"$type": "number"}}
+
+    if after is not None:
+        ts, oid = _parse_after(after)
+        query["$or"] = [
+            {"timestamp": {"$gt": ts}},
+            {"timestamp": ts, "_id": {"$gt": oid}}
+        ]
+
+    return list(
+        collection.find(query, projection=SPECIFIC_PROJECTION)
+        .sort([("timestamp", ASCENDING), ("_id", ASCENDING)])
+        .skip(offset)
+        .limit(limit)
+        .batch_size(limit)
+    )
+
+
 @app.get("/specific/{collection_name}")
 def get_specific_data(
     collection_name: str,
     dns: Optional[str] = None,
     command: Optional[str] = None,
     file: Optional[str] = None,
-    limit: int = 50,
-    offset: int = 0,
+    limit: int = Query(50, ge=1),
+    offset: int = Query(0, ge=0),
+    after: Optional[str] = Query(None, description="next_cursor of the previous page"),
 ):
-    if collection_name not in db.list_collection_names():
+    if not _known(collection_name):
         raise HTTPException(status_code=404, detail="Collection not found")
 
     collection = db[collection_name]
@@ -303,9 +744,9 @@ def get_specific_data(
             }
         }
 
-        cursor = collection.find(query).skip(offset).limit(limit)
+        events = _find_page(collection, query, after, offset, limit)
 
-        for event in cursor:
+        for event in events:
             results.append({
                 "process": event.get("processName"),
                 "process_id": event.get("processId"),
@@ -314,7 +755,10 @@ def get_specific_data(
                 "args": event.get("args")  # FULL ARRAY
             })
 
-        return {"specific": {"dns_calls": {dns: results}}}
+        return {
+            "specific": {"dns_calls": {dns: results}},
+            "next_cursor": _next_cursor(events, limit)
+        }
 
     # -------------------------
     # COMMAND SPECIFIC QUERY (FULL ARGS SAFE)
@@ -330,9 +774,9 @@ def get_specific_data(
             }
         }
 
-        cursor = collection.find(query).skip(offset).limit(limit)
+        events = _find_page(collection, query, after, offset, limit)
 
-        for event in cursor:
+        for event in events:
             results.append({
                 "process": event.get("processName"),
                 "process_id": event.get("processId"),
@@ -342,7 +786,10 @@ def get_specific_data(
                 "args": event.get("args")  # FULL ARGS ARRAY PRESERVED
             })
 
-        return {"specific": {"command_calls": {command: results}}}
+        return {
+            "specific": {"command_calls": {command: results}},
+            "next_cursor": _next_cursor(events, limit)
+        }
 
     # -------------------------
     # FILE ACCESS SPECIFIC QUERY
@@ -358,9 +805,9 @@ def get_specific_data(
             }
         }
 
-        cursor = collection.find(query).skip(offset).limit(limit)
+        events = _find_page(collection, query, after, offset, limit)
 
-        for event in cursor:
+        for event in events:
             results.append({
                 "process": event.get("processName"),
                 "process_id": event.get("processId"),
@@ -369,7 +816,10 @@ def get_specific_data(
                 "args": event.get("args")  # FULL ARRAY
             })
 
-        return {"specific": {"file_access": {file: results}}}
+        return {
+            "specific": {"file_access": {file: results}},
+            "next_cursor": _next_cursor(events, limit)
+        }
 
     raise HTTPException(
         status_code=400,
@@ -382,7 +832,7 @@ def stats_per_process(
     limit: int = 0,
     offset: int = 0
 ):
-    if collection_name not in db.list_collection_names():
+    if not _known(collection_name):
         raise HTTPException(status_code=404, detail="Collection not found")
 
     collection = db[collection_name]
@@ -417,7 +867,13 @@ def stats_per_process(
         # File access per process (excluding node_modules)
         # ---------------------
         file_pipeline = [
-            {"$match": {"processName": process, "eventName": "openat"}},
+            {
+                "$match": {
+                    "processName": process,
+                    "eventName": "openat",
+                    "args": {"$elemMatch": {"name": "pathname"}}
+                }
+            },
             {"$unwind": "$args"},
             {"$match": {"args.name": "pathname"}},
             {
@@ -443,7 +899,13 @@ def stats_per_process(
         # Executed commands per process
         # ---------------------
         exec_pipeline = [
-            {"$match": {"processName": process, "eventName": "execve"}},
+            {
+                "$match": {
+                    "processName": process,
+                    "eventName": "execve",
+                    "args": {"$elemMatch": {"name": "pathname"}}
+                }
+            },
             {"$unwind": "$args"},
             {"$match": {"args.name": "pathname"}},
             {
@@ -463,7 +925,13 @@ def stats_per_process(
         # DNS queries per process
         # ---------------------
         dns_pipeline = [
-            {"$match": {"processName": process, "eventName": "net_packet_dns_request"}},
+            {
+                "$match": {
+                    "processName": process,
+                    "eventName": "net_packet_dns_request",
+                    "args": {"$elemMatch": {"name": "dns_questions"}}
+                }
+            },
             {"$unwind": "$args"},
             {"$match": {"args.name": "dns_questions"}},
             {"$unwind": "$args.value"},
@@ -484,7 +952,13 @@ def stats_per_process(
         # IP connections per process
         # ---------------------
         ip_pipeline = [
-            {"$match": {"processName": process, "eventName": "connect"}},
+            {
+                "$match": {
+                    "processName": process,
+                    "eventName": "connect",
+                    "args": {"$elemMatch": {"name": "addr"}}
+                }
+            },
             {"$unwind": "$args"},
             {"$match": {"args.name": "addr"}},
             {